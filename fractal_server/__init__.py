@@ -33,7 +33,17 @@ async def __on_startup():
 
 
 def start_application() -> FastAPI:
-    app = FastAPI()
+    from .config import settings
+
+    if settings.ORJSON_RESPONSE:
+        # Fail at startup, rather than on the first response, if the `orjson`
+        # extra is not installed
+        import orjson  # noqa: F401
+        from fastapi.responses import ORJSONResponse
+
+        app = FastAPI(default_response_class=ORJSONResponse)
+    else:
+        app = FastAPI()
     collect_routers(app)
 
     app.add_middleware(
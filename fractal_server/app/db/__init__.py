@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import Session as DBSyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from ...config import settings
 
@@ -18,11 +19,18 @@ engine = create_async_engine(
     settings.DATABASE_URL, echo=settings.DB_ECHO, future=True
 )
 
+# An in-memory database only lives as long as its connections: keep a single
+# one open, as the aiosqlite dialect already does for `engine`
+DB_IN_MEMORY = settings.DB_ENGINE == "sqlite" and (
+    settings.SQLITE_PATH == ":memory:" or "mode=memory" in settings.SQLITE_PATH
+)
+
 engine_sync = create_engine(
     settings.DATABASE_SYNC_URL,
     echo=settings.DB_ECHO,
     future=True,
     connect_args={"check_same_thread": False},
+    poolclass=StaticPool if DB_IN_MEMORY else None,
 )
 
 async_session_maker = sessionmaker(
@@ -90,20 +90,22 @@ async def submit_workflow(
         formatter=logging.Formatter("%(asctime)s; %(levelname)s; %(message)s"),
     )
 
-    logger.info(f"fractal_server.__VERSION__: {__VERSION__}")
-    logger.info(f"START workflow {workflow.name}")
-    output_dataset.meta = await process_workflow(
-        workflow=workflow,
-        input_paths=input_paths,
-        output_path=output_path,
-        input_metadata=input_dataset.meta,
-        username=username,
-        logger=logger,
-        workflow_dir=WORKFLOW_DIR,
-    )
+    try:
+        logger.info(f"fractal_server.__VERSION__: {__VERSION__}")
+        logger.info(f"START workflow {workflow.name}")
+        output_dataset.meta = await process_workflow(
+            workflow=workflow,
+            input_paths=input_paths,
+            output_path=output_path,
+            input_metadata=input_dataset.meta,
+            username=username,
+            logger=logger,
+            workflow_dir=WORKFLOW_DIR,
+        )
+        logger.info(f'END workflow "{workflow.name}"')
+    finally:
+        close_job_logger(logger)
 
-    logger.info(f'END workflow "{workflow.name}"')
-    close_job_logger(logger)
     db.add(output_dataset)
 
     await db.commit()
@@ -4,7 +4,10 @@ import logging
 from functools import partial
 from functools import wraps
 from json import JSONEncoder
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
 from pathlib import Path
+from queue import SimpleQueue
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -72,39 +75,95 @@ def validate_workflow_compatibility(
 ):
     """
     Check compatibility of workflow and input / ouptut dataset
+
+    Returns
+    -------
+    output_path (Path):
+        the single path of the output dataset, or of the input dataset if
+        no output dataset is provided and the input is to be overwritten
     """
-    if (
-        workflow.input_type != "Any"
-        and workflow.input_type != input_dataset.type
-    ):
+    if workflow.input_type not in ("Any", input_dataset.type):
         raise TypeError(
             f"Incompatible types `{workflow.input_type}` of workflow "
             f"`{workflow.name}` and `{input_dataset.type}` of dataset "
             f"`{input_dataset.name}`"
         )
 
-    if not output_dataset:
-        if input_dataset.read_only:
-            raise ValueError("Input dataset is read-only")
-        else:
-            input_paths = input_dataset.paths
-            if len(input_paths) != 1:
-                # Only single input can be safely transformed in an output
-                raise ValueError(
-                    "Cannot determine output path: multiple input "
-                    "paths to overwrite"
-                )
-            else:
-                output_path = input_paths[0]
-    else:
+    overwrite_input = output_dataset is None
+    if overwrite_input and input_dataset.read_only:
+        raise ValueError("Input dataset is read-only")
 
-        if len(output_dataset.paths) != 1:
+    # `Dataset.paths` is computed from the resource list: only read it once
+    source = input_dataset if output_dataset is None else output_dataset
+    paths = source.paths
+    if len(paths) != 1:
+        # Only a single path can be safely used as output
+        if overwrite_input:
             raise ValueError(
-                "Cannot determine output path: Multiple paths in dataset."
+                "Cannot determine output path: multiple input "
+                "paths to overwrite"
             )
-        else:
-            output_path = output_dataset.paths[0]
-    return output_path
+        raise ValueError(
+            "Cannot determine output path: Multiple paths in dataset."
+        )
+    return paths[0]
+
+
+class JobLogHandler(QueueHandler):
+    """
+    Queue handler that writes job log records to file from a separate thread
+
+    Records are formatted and put on a queue by the logging thread (e.g. the
+    event loop), while a `QueueListener` consumes them and writes them to
+    `log_file_path` through a `FileHandler`, so that file I/O does not block
+    the caller.
+    """
+
+    def __init__(
+        self,
+        log_file_path: Path,
+        level: int = logging.NOTSET,
+        formatter: Optional[logging.Formatter] = None,
+    ):
+        log_queue: SimpleQueue = SimpleQueue()
+        super().__init__(log_queue)
+        # `QueueHandler.prepare` already formats each record with `formatter`:
+        # the file handler keeps the default formatter, which only writes
+        # the resulting message
+        self.file_handler = logging.FileHandler(log_file_path, mode="a")
+        self.setLevel(level)
+        self.setFormatter(formatter)
+        self.listener = QueueListener(
+            log_queue, self.file_handler, respect_handler_level=True
+        )
+        self._listening = False
+        self.start()
+
+    @property
+    def baseFilename(self) -> str:
+        return self.file_handler.baseFilename
+
+    def setLevel(self, level) -> None:
+        super().setLevel(level)
+        self.file_handler.setLevel(level)
+
+    def start(self) -> None:
+        """
+        Start writing queued records to file, if not already doing so
+        """
+        if not self._listening:
+            self.listener.start()
+            self._listening = True
+
+    def close(self) -> None:
+        """
+        Write all queued records to file and close the file
+        """
+        if self._listening:
+            self.listener.stop()
+            self._listening = False
+        self.file_handler.close()
+        super().close()
 
 
 def set_job_logger(
@@ -116,22 +175,48 @@ def set_job_logger(
 ) -> logging.Logger:
     """
     Return a dedicated per-job logger
+
+    Records are written to `log_file_path` by a `JobLogHandler`, call
+    `close_job_logger` to flush them once the job is over.
     """
     logger = logging.getLogger(logger_name)
     logger.setLevel(level)
-    file_handler = logging.FileHandler(log_file_path, mode="a")
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # Job records only go to the job log file, not to the root logger
+    logger.propagate = False
+
+    # `logging.getLogger` returns a cached instance: reuse the handler for the
+    # same file, and close the ones for other files, when the logger is set
+    # up again
+    for handler in list(logger.handlers):
+        if not isinstance(handler, (JobLogHandler, logging.FileHandler)):
+            continue
+        if (
+            isinstance(handler, JobLogHandler)
+            and Path(handler.baseFilename).resolve()
+            == Path(log_file_path).resolve()
+        ):
+            handler.setLevel(level)
+            handler.setFormatter(formatter)
+            handler.start()
+            return logger
+        handler.close()
+        logger.removeHandler(handler)
+
+    logger.addHandler(
+        JobLogHandler(log_file_path, level=level, formatter=formatter)
+    )
     return logger
 
 
 def close_job_logger(logger: logging.Logger) -> None:
     """
-    Close all FileHandles of `logger`
+    Flush, close and remove all FileHandles of `logger`
     """
-    for handle in logger.handlers:
-        if isinstance(handle, logging.FileHandler):
+    for handle in list(logger.handlers):
+        if isinstance(handle, (JobLogHandler, logging.FileHandler)):
+            handle.flush()
             handle.close()
+            logger.removeHandler(handle)
 
 
 def async_wrap(func: Callable) -> Callable:
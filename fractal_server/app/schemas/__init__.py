@@ -3,20 +3,44 @@ from typing import Optional
 
 from sqlmodel import SQLModel
 
-from .project import *  # noqa: F403
-from .task import *  # noqa: F403
-from .workflow import *  # noqa: F403
+from .project import DatasetCreate
+from .project import DatasetRead
+from .project import DatasetUpdate
+from .project import ProjectCreate
+from .project import ProjectRead
+from .project import ResourceCreate
+from .project import ResourceRead
+from .project import ResourceUpdate
+from .task import TaskCreate
+from .task import TaskRead
+from .task import TaskUpdate
+from .workflow import WorkflowCreate
+from .workflow import WorkflowRead
+from .workflow import WorkflowTaskCreate
+from .workflow import WorkflowTaskRead
+from .workflow import WorkflowUpdate
 
 
 __all__ = (
-    (
-        "ApplyWorkflowBase",
-        "ApplyWorkflowCreate",
-        "ApplyWorkflowRead",
-    )
-    + project.__all__  # noqa: F405
-    + task.__all__  # noqa: F405
-    + workflow.__all__  # noqa: F405
+    "ApplyWorkflowBase",
+    "ApplyWorkflowCreate",
+    "ApplyWorkflowRead",
+    "ProjectCreate",
+    "ProjectRead",
+    "DatasetUpdate",
+    "DatasetCreate",
+    "DatasetRead",
+    "ResourceCreate",
+    "ResourceRead",
+    "ResourceUpdate",
+    "TaskCreate",
+    "TaskUpdate",
+    "TaskRead",
+    "WorkflowCreate",
+    "WorkflowRead",
+    "WorkflowUpdate",
+    "WorkflowTaskCreate",
+    "WorkflowTaskRead",
 )
 
 
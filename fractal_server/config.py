@@ -97,16 +97,23 @@ class Settings(BaseSettings):
     elif DB_ENGINE == "sqlite":
         SQLITE_PATH: str = fail_getenv("SQLITE_PATH")
 
-        DATABASE_URL = (
-            "sqlite+aiosqlite:///"
-            f"{abspath(SQLITE_PATH) if SQLITE_PATH else SQLITE_PATH}"
-        )
+        if SQLITE_PATH.startswith(("file:", ":memory:")):
+            # In-memory database or SQLite URI filename, not a path on disk
+            DATABASE_URL = f"sqlite+aiosqlite:///{SQLITE_PATH}"
+        else:
+            DATABASE_URL = (
+                "sqlite+aiosqlite:///"
+                f"{abspath(SQLITE_PATH) if SQLITE_PATH else SQLITE_PATH}"
+            )
         DATABASE_SYNC_URL = DATABASE_URL.replace("aiosqlite", "pysqlite")
 
     ###########################################################################
     # FRACTAL SPECIFIC
     ###########################################################################
 
+    # Serialize API responses with orjson (requires the `orjson` extra)
+    ORJSON_RESPONSE: bool = bool(int(getenv("ORJSON_RESPONSE", "0")))
+
     @root_validator(pre=True)
     def collect_oauth_clients(cls, values):
         oauth_env_variable_keys = [
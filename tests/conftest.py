@@ -1,8 +1,18 @@
+from os import getenv
 from pathlib import Path
 
 import pytest
 
 
+if getenv("CI"):
+    # `devtools.debug` inspects the caller frame and source at every call,
+    # and its output is not looked at in CI. This must run before test
+    # modules are imported, as they do `from devtools import debug`.
+    import devtools
+
+    devtools.debug = lambda *args, **kwargs: None
+
+
 @pytest.fixture(scope="session")
 async def testdata_path() -> Path:
     TEST_DIR = Path(__file__).parent
@@ -13,8 +13,10 @@ Zurich.
 import asyncio
 from dataclasses import dataclass
 from dataclasses import field
+from functools import partial
 from typing import Any
 from typing import AsyncGenerator
+from typing import Dict
 from typing import List
 from typing import Optional
 from uuid import uuid4
@@ -43,15 +45,82 @@ def override_environment(testdata_path):
     environ["DATA_DIR_ROOT"] = testdata_path.as_posix()
 
     environ["DB_ENGINE"] = "sqlite"
-    # Shared in memory database,
-    # c.f., https://stackoverflow.com/a/38089822/283972
-    environ["SQLITE_PATH"] = "_test.db?mode=memory&cache=shared"
+    # In-memory database, shared by the sync and async engines through a
+    # named shared cache (a plain `:memory:` database is private to each
+    # connection), c.f., https://www.sqlite.org/inmemorydb.html
+    environ[
+        "SQLITE_PATH"
+    ] = "file:fractal_test?mode=memory&cache=shared&uri=true"
 
     from fractal_server.config import settings
 
     return settings
 
 
+@dataclass
+class _MockCurrentUser:
+    """
+    Context managed user override
+    """
+
+    name: str = "User Name"
+    scopes: Optional[List[str]] = field(default_factory=lambda: ["project"])
+    email: Optional[str] = field(
+        default_factory=lambda: f"{uuid4()}@exact-lab.it"
+    )
+    persist: Optional[bool] = False
+    # Bound once per test by the `MockCurrentUser` fixture
+    app: Optional[FastAPI] = field(default=None, repr=False, compare=False)
+    db: Optional[AsyncSession] = field(default=None, repr=False, compare=False)
+
+    def _create_user(self):
+        from fractal_server.app.security import User
+
+        self.user = User(
+            name=self.name,
+            email=self.email,
+            hashed_password="fake_hashed_password",
+        )
+
+    def current_active_user_override(self):
+        def __current_active_user_override():
+            return self.user
+
+        return __current_active_user_override
+
+    async def __aenter__(self):
+        from fractal_server.app.security import current_active_user
+
+        self._create_user()
+
+        if self.persist:
+            self.db.add(self.user)
+            # No refresh needed: the primary key is generated client-side
+            await self.db.commit()
+            # Removing object from test db session, so that we can operate
+            # on user from other sessions
+            self.db.expunge(self.user)
+        self.previous_user = self.app.dependency_overrides.get(
+            current_active_user, None
+        )
+        self.app.dependency_overrides[
+            current_active_user
+        ] = self.current_active_user_override()
+        return self.user
+
+    async def __aexit__(self, *args, **kwargs):
+        from fractal_server.app.security import current_active_user
+
+        # The app is shared by the whole test session: always restore the
+        # previous state of the override
+        if self.previous_user:
+            self.app.dependency_overrides[
+                current_active_user
+            ] = self.previous_user
+        else:
+            self.app.dependency_overrides.pop(current_active_user, None)
+
+
 @pytest.fixture
 def unset_deployment_type():
     from os import environ
@@ -86,68 +155,110 @@ def db_sync_engine(patch_settings):
     yield engine_sync
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def db_session_maker(
     db_engine, app
 ) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create the database schema once and override `get_db` for the session
+    """
     import fractal_server.app.models  # noqa F401 make sure models are imported
     from sqlmodel import SQLModel
 
     async with db_engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
-        async_session_maker = sessionmaker(
-            db_engine, class_=AsyncSession, expire_on_commit=False
-        )
 
-        async def _get_db():
-            async with async_session_maker() as session:
-                yield session
+    async_session_maker = sessionmaker(
+        db_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def _get_db():
+        async with async_session_maker() as session:
+            yield session
 
-        from fractal_server.app.db import get_db
+    from fractal_server.app.db import get_db
 
-        app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_db] = _get_db
 
-        yield async_session_maker
+    yield async_session_maker
 
+    async with db_engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.drop_all)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def db_sync_session_maker(db_sync_engine, app):
+    """
+    Build the sync session factory once and override `get_sync_db`
+    """
     from fractal_server.app.db import get_sync_db
     from sqlmodel import Session
 
+    sync_session_maker = sessionmaker(
+        db_sync_engine, class_=Session, expire_on_commit=False
+    )
+
     def _get_sync_db():
-        with Session(db_sync_engine) as session:
+        with sync_session_maker() as session:
             yield session
 
     app.dependency_overrides[get_sync_db] = _get_sync_db
 
+    yield sync_session_maker
+
+
+@pytest.fixture(scope="session")
+def db_template(db_session_maker, db_sync_engine):
+    """
+    In-memory copy of the freshly created (empty) database
+
+    Restoring it with the SQLite backup API resets the test database without
+    running any DDL or per-table DELETE.
+    """
+    import sqlite3
+
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    raw_connection = db_sync_engine.raw_connection()
+    try:
+        raw_connection.connection.backup(template)
+    finally:
+        raw_connection.close()
+    yield template
+    template.close()
+
 
 @pytest.fixture
-async def db(db_session_maker):
+async def db(db_session_maker, db_template, db_sync_engine):
+    """
+    Yield a database session, and restore the empty database once the test
+    is over
+    """
     async with db_session_maker() as session:
         yield session
 
+    raw_connection = db_sync_engine.raw_connection()
+    try:
+        db_template.backup(raw_connection.connection)
+    finally:
+        raw_connection.close()
 
-@pytest.fixture()
-def db_sync(db_sync_engine):
-    from sqlmodel import Session
 
-    with Session(db_sync_engine) as session:
+@pytest.fixture()
+def db_sync(db_sync_session_maker):
+    with db_sync_session_maker() as session:
         from devtools import debug
 
         debug(f"yielding session {id(session)}")
         yield session
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def app(patch_settings) -> AsyncGenerator[FastAPI, Any]:
     app = FastAPI()
     yield app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def register_routers(app):
     from fractal_server import collect_routers
 
@@ -161,10 +272,15 @@ async def collect_tasks(db):
     await collect_tasks_headless()
 
 
-@pytest.fixture
-async def client(
-    app: FastAPI, register_routers, db, db_sync
+@pytest.fixture(scope="session")
+async def session_client(
+    app: FastAPI, register_routers, db_session_maker
 ) -> AsyncGenerator[AsyncClient, Any]:
+    """
+    Client shared by the whole test session
+
+    The app lifespan (startup and shutdown events) only runs once.
+    """
     async with AsyncClient(
         app=app, base_url="http://test"
     ) as client, LifespanManager(app):
@@ -172,146 +288,173 @@ async def client(
 
 
 @pytest.fixture
-async def MockCurrentUser(app, db):
-    from fractal_server.app.security import current_active_user
-    from fractal_server.app.security import User
-
-    @dataclass
-    class _MockCurrentUser:
-        """
-        Context managed user override
-        """
+async def client(
+    session_client: AsyncClient, db, db_sync
+) -> AsyncGenerator[AsyncClient, Any]:
+    """
+    Yield the session client; `db` restores the empty database afterwards
+    """
+    yield session_client
+    session_client.cookies.clear()
 
-        name: str = "User Name"
-        scopes: Optional[List[str]] = field(
-            default_factory=lambda: ["project"]
-        )
-        email: Optional[str] = field(
-            default_factory=lambda: f"{uuid4()}@exact-lab.it"
-        )
-        persist: Optional[bool] = False
 
-        def _create_user(self):
-            self.user = User(
-                name=self.name,
-                email=self.email,
-                hashed_password="fake_hashed_password",
-            )
+@pytest.fixture
+async def MockCurrentUser(app, db):
+    return partial(_MockCurrentUser, app=app, db=db)
 
-        def current_active_user_override(self):
-            def __current_active_user_override():
-                return self.user
 
-            return __current_active_user_override
+@pytest.fixture
+async def project_factory_bulk(db):
+    """
+    Factory that adds several projects to the database, with a single commit
 
-        async def __aenter__(self):
-            self._create_user()
+    The returned objects are not refreshed: their `id` is set by the INSERT,
+    but relationships are not loaded (call `db.refresh` if a test needs them).
+    """
+    from fractal_server.app.models import Project
 
-            if self.persist:
-                db.add(self.user)
-                await db.commit()
-                await db.refresh(self.user)
-                # Removing object from test db session, so that we can operate
-                # on user from other sessions
-                db.expunge(self.user)
-            self.previous_user = app.dependency_overrides.get(
-                current_active_user, None
+    async def __project_factory_bulk(
+        user, kwargs_list: List[Dict[str, Any]]
+    ) -> List[Project]:
+        project_list = []
+        for kwargs in kwargs_list:
+            defaults = dict(
+                name="project",
+                project_dir="/tmp/",
+                slug="slug",
             )
-            app.dependency_overrides[
-                current_active_user
-            ] = self.current_active_user_override()
-            return self.user
-
-        async def __aexit__(self, *args, **kwargs):
-            if self.previous_user:
-                app.dependency_overrides[
-                    current_active_user
-                ] = self.previous_user()
+            defaults.update(kwargs)
+            project = Project(**defaults)
+            project.user_member_list.append(user)
+            project_list.append(project)
+        db.add_all(project_list)
+        await db.commit()
+        return project_list
 
-    return _MockCurrentUser
+    return __project_factory_bulk
 
 
 @pytest.fixture
-async def project_factory(db):
+async def project_factory(project_factory_bulk):
     """
     Factory that adds a project to the database
     """
-    from fractal_server.app.models import Project
 
     async def __project_factory(user, **kwargs):
-        defaults = dict(
-            name="project",
-            project_dir="/tmp/",
-            slug="slug",
-        )
-        defaults.update(kwargs)
-        project = Project(**defaults)
-        project.user_member_list.append(user)
-        db.add(project)
-        await db.commit()
-        await db.refresh(project)
-        return project
+        return (await project_factory_bulk(user, [kwargs]))[0]
 
     return __project_factory
 
 
 @pytest.fixture
-async def dataset_factory(db):
+async def dataset_factory_bulk(db):
+    """
+    Factory that adds several datasets to a project, with a single commit
+    """
     from fractal_server.app.models import Project, Dataset
 
-    async def __dataset_factory(project: Project, **kwargs):
-        defaults = dict(name="test dataset")
-        defaults.update(kwargs)
-        project.dataset_list.append(Dataset(**defaults))
-        db.add(project)
+    async def __dataset_factory_bulk(
+        project: Project, kwargs_list: List[Dict[str, Any]]
+    ) -> List[Dataset]:
+        dataset_list = []
+        for kwargs in kwargs_list:
+            defaults = dict(name="test dataset")
+            defaults.update(kwargs)
+            dataset_list.append(Dataset(project_id=project.id, **defaults))
+        db.add_all(dataset_list)
         await db.commit()
-        await db.refresh(project)
-        return project.dataset_list[-1]
+        return dataset_list
+
+    return __dataset_factory_bulk
+
+
+@pytest.fixture
+async def dataset_factory(dataset_factory_bulk):
+    from fractal_server.app.models import Project
+
+    async def __dataset_factory(project: Project, **kwargs):
+        return (await dataset_factory_bulk(project, [kwargs]))[0]
 
     return __dataset_factory
 
 
 @pytest.fixture
-async def resource_factory(db, testdata_path):
+async def resource_factory_bulk(db, testdata_path):
+    """
+    Factory that adds several resources to a dataset, with a single commit
+    """
     from fractal_server.app.models import Dataset, Resource
 
+    async def __resource_factory_bulk(
+        dataset: Dataset, kwargs_list: List[Dict[str, Any]]
+    ) -> List[Resource]:
+        resource_list = []
+        for kwargs in kwargs_list:
+            defaults = dict(
+                path=(testdata_path / "png").as_posix(), glob_pattern="*.png"
+            )
+            defaults.update(kwargs)
+            resource_list.append(Resource(dataset_id=dataset.id, **defaults))
+        db.add_all(resource_list)
+        await db.commit()
+        return resource_list
+
+    return __resource_factory_bulk
+
+
+@pytest.fixture
+async def resource_factory(resource_factory_bulk):
+    from fractal_server.app.models import Dataset
+
     async def __resource_factory(dataset: Dataset, **kwargs):
         """
         Add a new resorce to dataset
         """
-        defaults = dict(
-            path=(testdata_path / "png").as_posix(), glob_pattern="*.png"
-        )
-        defaults.update(kwargs)
-        resource = Resource(dataset_id=dataset.id, **defaults)
-        db.add(resource)
-        await db.commit()
-        await db.refresh(dataset)
-        return dataset.resource_list[-1]
+        return (await resource_factory_bulk(dataset, [kwargs]))[0]
 
     return __resource_factory
 
 
 @pytest.fixture
-async def task_factory(db: AsyncSession):
+async def task_factory_bulk(db: AsyncSession):
     """
-    Insert task in db
+    Insert several tasks in db, with a single commit
+
+    Default names are `task{first_index}`, `task{first_index + 1}`, ...
     """
     from fractal_server.app.models import Task
 
-    async def __task_factory(db: AsyncSession = db, index: int = 0, **kwargs):
-        defaults = dict(
-            name=f"task{index}",
-            input_type="zarr",
-            output_type="zarr",
-            command="cmd",
-            source="source",
-        )
-        args = dict(**defaults)
-        args.update(kwargs)
-        t = Task(**args)
-        db.add(t)
+    async def __task_factory_bulk(
+        kwargs_list: List[Dict[str, Any]],
+        db: AsyncSession = db,
+        first_index: int = 0,
+    ) -> List[Task]:
+        task_list = []
+        for index, kwargs in enumerate(kwargs_list, start=first_index):
+            args = dict(
+                name=f"task{index}",
+                input_type="zarr",
+                output_type="zarr",
+                command="cmd",
+                source="source",
+            )
+            args.update(kwargs)
+            task_list.append(Task(**args))
+        db.add_all(task_list)
         await db.commit()
+        return task_list
+
+    return __task_factory_bulk
+
+
+@pytest.fixture
+async def task_factory(db: AsyncSession, task_factory_bulk):
+    """
+    Insert task in db
+    """
+
+    async def __task_factory(db: AsyncSession = db, index: int = 0, **kwargs):
+        t = (await task_factory_bulk([kwargs], db=db, first_index=index))[0]
         await db.refresh(t)
         return t
 
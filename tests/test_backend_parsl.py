@@ -8,6 +8,7 @@ from devtools import debug
 
 from .fixtures_tasks import MockTask
 from .fixtures_tasks import MockWorkflowTask
+from fractal_server.app.runner.common import close_job_logger
 from fractal_server.app.runner.common import set_job_logger
 from fractal_server.app.runner.common import TaskParameters
 from fractal_server.tasks import dummy as dummy_module
@@ -42,7 +43,7 @@ def test_unit_serial_task_assembly(tmp_path):
     )
 
     logger_name = "test_logger"
-    set_job_logger(
+    job_logger = set_job_logger(
         logger_name=logger_name,
         log_file_path=tmp_path / "task.log",
         level=logging.DEBUG,
@@ -70,6 +71,7 @@ def test_unit_serial_task_assembly(tmp_path):
             workflow_dir=tmp_path,
         )
         debug(out.result())
+    close_job_logger(job_logger)
 
     # metadata file exists
     output_file = tmp_path / "0.metadiff.json"
@@ -19,6 +19,7 @@ from devtools import debug
 
 from .fixtures_tasks import MockTask
 from .fixtures_tasks import MockWorkflowTask
+from fractal_server.app.runner import close_job_logger
 from fractal_server.app.runner import set_job_logger
 from fractal_server.app.runner._common import _call_command_wrapper
 from fractal_server.app.runner._process import call_single_task
@@ -107,6 +108,7 @@ def test_recursive_task_submission_step0(tmp_path):
         )
         debug(res.result())
         assert res.result().metadata["dummy"] == f"dummy {INDEX}"
+    close_job_logger(job_logger)
 
 
 def test_recursive_parallel_task_submission_step0(tmp_path):
@@ -154,6 +156,7 @@ def test_recursive_parallel_task_submission_step0(tmp_path):
         )
         debug(res.result())
         assert MOCKPARALLELTASK_NAME in res.result().metadata["history"][0]
+    close_job_logger(job_logger)
 
     # Validate results
     assert output_path.parent.exists()
@@ -215,8 +218,9 @@ def test_recursive_task_submission_inductive_step(tmp_path):
             task_pars=task_pars,
             workflow_dir=tmp_path,
         )
+        output = res.result()
+    close_job_logger(job_logger)
 
-    output = res.result()
     debug(output)
     with open(output.output_path, "r") as f:
         data = json.load(f)
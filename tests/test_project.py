@@ -254,12 +254,11 @@ async def test_edit_resource(
 
 
 async def test_delete_dataset(
-    client, MockCurrentUser, project_factory, dataset_factory
+    client, MockCurrentUser, project_factory, dataset_factory_bulk
 ):
     async with MockCurrentUser(persist=True) as user:
         prj = await project_factory(user)
-        ds0 = await dataset_factory(project=prj)
-        ds1 = await dataset_factory(project=prj)
+        ds0, ds1 = await dataset_factory_bulk(prj, [dict(), dict()])
 
         ds_ids = (ds0.id, ds1.id)
 
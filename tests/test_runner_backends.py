@@ -19,6 +19,7 @@ from devtools import debug
 from fractal_server.app.models import Task
 from fractal_server.app.models import Workflow
 from fractal_server.app.runner import _backends
+from fractal_server.app.runner import close_job_logger
 from fractal_server.app.runner import set_job_logger
 from fractal_server.tasks import dummy
 from fractal_server.tasks import dummy_parallel
@@ -77,19 +78,22 @@ async def test_runner(db, project_factory, MockCurrentUser, tmp_path, backend):
 
     # process workflow
     logger_name = "job_logger"
-    set_job_logger(
+    job_logger = set_job_logger(
         logger_name=logger_name,
         log_file_path=tmp_path / "job.log",
         level=logging.DEBUG,
     )
-    out = await process_workflow(
-        workflow=wf,
-        input_paths=[tmp_path / "*.txt"],
-        output_path=tmp_path / "out.json",
-        input_metadata={},
-        logger_name=logger_name,
-        workflow_dir=tmp_path,
-    )
+    try:
+        out = await process_workflow(
+            workflow=wf,
+            input_paths=[tmp_path / "*.txt"],
+            output_path=tmp_path / "out.json",
+            input_metadata={},
+            logger_name=logger_name,
+            workflow_dir=tmp_path,
+        )
+    finally:
+        close_job_logger(job_logger)
     debug(out)
     assert "dummy" in out.metadata
     assert "dummy" in out.metadata
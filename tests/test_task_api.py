@@ -56,9 +56,10 @@ async def test_collection(db, client, MockCurrentUser):
     assert n_tasks == n_target
 
 
-async def test_task_get_list(db, client, task_factory, MockCurrentUser):
-    t0 = await task_factory(name="task0")
-    t1 = await task_factory(name="task1")
+async def test_task_get_list(
+    db, client, task_factory, task_factory_bulk, MockCurrentUser
+):
+    t0, t1 = await task_factory_bulk([dict(name="task0"), dict(name="task1")])
     t2 = await task_factory(index=2, subtask_list=[t0, t1])
 
     async with MockCurrentUser(persist=True):
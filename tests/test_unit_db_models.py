@@ -1,3 +1,5 @@
+import math
+
 import pytest
 from devtools import debug
 from sqlalchemy.exc import IntegrityError
@@ -190,3 +192,51 @@ async def test_cascade_delete_project(
         assert not set(after_delete_wf_ids).intersection(
             set(before_delete_wf_ids)
         )
+
+
+async def test_bulk_factories(
+    db,
+    MockCurrentUser,
+    project_factory_bulk,
+    dataset_factory_bulk,
+    resource_factory_bulk,
+    task_factory_bulk,
+):
+    """
+    GIVEN the bulk factories
+    WHEN they are called with a list of keyword arguments
+    THEN one object per item is stored in the database
+    """
+    async with MockCurrentUser(persist=True) as user:
+        p0, p1 = await project_factory_bulk(
+            user, [dict(name="p0"), dict(name="p1")]
+        )
+    ds0, ds1 = await dataset_factory_bulk(p0, [dict(), dict(name="ds1")])
+    await resource_factory_bulk(ds0, [dict(), dict()])
+    t0, t1, t2 = await task_factory_bulk([dict(), dict(), dict()])
+
+    await db.refresh(p0)
+    assert p1.id and p0.id != p1.id
+    assert [ds.id for ds in p0.dataset_list] == [ds0.id, ds1.id]
+    await db.refresh(ds0)
+    assert len(ds0.resource_list) == 2
+    assert [t.name for t in (t0, t1, t2)] == ["task0", "task1", "task2"]
+
+
+async def test_json_column_roundtrip(
+    db, MockCurrentUser, project_factory, dataset_factory
+):
+    """
+    GIVEN a dataset whose metadata contains NaN, infinity and a large integer
+    WHEN it is stored and read back from the database
+    THEN the metadata is unchanged
+    """
+    async with MockCurrentUser(persist=True) as user:
+        prj = await project_factory(user)
+    meta = dict(nan=float("nan"), inf=float("inf"), big=2**70)
+    ds = await dataset_factory(prj, meta=meta)
+
+    await db.refresh(ds)
+    assert math.isnan(ds.meta["nan"])
+    assert ds.meta["inf"] == float("inf")
+    assert ds.meta["big"] == 2**70
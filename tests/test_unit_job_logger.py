@@ -0,0 +1,85 @@
+import logging
+
+from fractal_server.app.runner.common import close_job_logger
+from fractal_server.app.runner.common import set_job_logger
+
+
+def test_set_job_logger_no_duplicate_handlers(tmp_path):
+    """
+    GIVEN a job logger set up on a given file
+    WHEN it is set up again on the same file
+    THEN no additional handler is attached, and each record is written once
+    """
+    log_file_path = tmp_path / "job.log"
+    for _ in range(3):
+        logger = set_job_logger(
+            logger_name="test_no_duplicate_handlers",
+            log_file_path=log_file_path,
+            level=logging.INFO,
+        )
+    assert len(logger.handlers) == 1
+
+    logger.info("a record")
+    close_job_logger(logger)
+    assert not logger.handlers
+    assert log_file_path.read_text().count("a record") == 1
+
+
+def test_job_logger_reopen_after_close(tmp_path):
+    """
+    GIVEN a job logger that has been closed
+    WHEN it is set up again on the same file
+    THEN records are still written to file
+    """
+    log_file_path = tmp_path / "job.log"
+    for message in ("first record", "second record"):
+        logger = set_job_logger(
+            logger_name="test_reopen_after_close",
+            log_file_path=log_file_path,
+            level=logging.INFO,
+        )
+        logger.info(message)
+        close_job_logger(logger)
+
+    log = log_file_path.read_text()
+    assert "first record" in log
+    assert "second record" in log
+
+
+def test_set_job_logger_new_file(tmp_path):
+    """
+    GIVEN a job logger set up on a given file
+    WHEN it is set up again on another file
+    THEN the handler for the first file is replaced, and records only go to
+         the second file
+    """
+    for name in ("a.log", "b.log"):
+        logger = set_job_logger(
+            logger_name="test_new_file",
+            log_file_path=tmp_path / name,
+            level=logging.INFO,
+        )
+    assert len(logger.handlers) == 1
+
+    logger.info("a record")
+    close_job_logger(logger)
+    assert "a record" not in (tmp_path / "a.log").read_text()
+    assert "a record" in (tmp_path / "b.log").read_text()
+
+
+def test_job_logger_formatter(tmp_path):
+    """
+    GIVEN a job logger with a formatter
+    WHEN a record is logged
+    THEN the formatter is applied exactly once
+    """
+    log_file_path = tmp_path / "job.log"
+    logger = set_job_logger(
+        logger_name="test_formatter",
+        log_file_path=log_file_path,
+        level=logging.INFO,
+        formatter=logging.Formatter("%(levelname)s; %(message)s"),
+    )
+    logger.info("a %s", "record")
+    close_job_logger(logger)
+    assert log_file_path.read_text() == "INFO; a record\n"
@@ -0,0 +1,58 @@
+import sys
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from httpx import AsyncClient
+
+
+def _response_class(app):
+    route = next(r for r in app.routes if r.path == "/api/alive/")
+    # FastAPI wraps the default response class in a `DefaultPlaceholder`
+    return getattr(route.response_class, "value", route.response_class)
+
+
+async def test_default_response(patch_settings, monkeypatch):
+    """
+    GIVEN `ORJSON_RESPONSE` is not set
+    WHEN the application is started
+    THEN its routes respond through the stdlib JSONResponse
+    """
+    from fractal_server import start_application
+
+    monkeypatch.setattr(patch_settings, "ORJSON_RESPONSE", False)
+    app = start_application()
+    assert _response_class(app) is JSONResponse
+
+
+async def test_orjson_response(patch_settings, monkeypatch):
+    """
+    GIVEN `ORJSON_RESPONSE` is set and orjson is installed
+    WHEN the application is started
+    THEN its routes respond through ORJSONResponse
+    """
+    pytest.importorskip("orjson")
+    from fractal_server import start_application
+
+    monkeypatch.setattr(patch_settings, "ORJSON_RESPONSE", True)
+    app = start_application()
+    assert _response_class(app) is ORJSONResponse
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        res = await client.get("/api/alive/")
+    assert res.status_code == 200
+    assert res.json()["alive"] is True
+
+
+def test_orjson_response_not_installed(patch_settings, monkeypatch):
+    """
+    GIVEN `ORJSON_RESPONSE` is set but orjson is not installed
+    WHEN the application is started
+    THEN it fails immediately
+    """
+    from fractal_server import start_application
+
+    monkeypatch.setattr(patch_settings, "ORJSON_RESPONSE", True)
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    with pytest.raises(ModuleNotFoundError):
+        start_application()
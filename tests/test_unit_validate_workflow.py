@@ -0,0 +1,71 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from fractal_server.app.runner.common import validate_workflow_compatibility
+
+
+def _dataset(paths, type="zarr", read_only=False):
+    return SimpleNamespace(
+        name="dataset", type=type, read_only=read_only, paths=paths
+    )
+
+
+def test_validate_workflow_compatibility():
+    """
+    GIVEN a workflow and input / output datasets
+    WHEN their compatibility is validated
+    THEN the output path is returned, or an error is raised
+    """
+    workflow = SimpleNamespace(name="workflow", input_type="zarr")
+    in_path, out_path = Path("/in"), Path("/out")
+
+    # Overwrite input
+    output_path = validate_workflow_compatibility(
+        input_dataset=_dataset([in_path]), workflow=workflow
+    )
+    assert output_path == in_path
+
+    # Explicit output
+    output_path = validate_workflow_compatibility(
+        input_dataset=_dataset([in_path, in_path]),
+        output_dataset=_dataset([out_path]),
+        workflow=workflow,
+    )
+    assert output_path == out_path
+
+    # Read-only input only matters when it is overwritten
+    with pytest.raises(ValueError, match="read-only"):
+        validate_workflow_compatibility(
+            input_dataset=_dataset([in_path], read_only=True),
+            workflow=workflow,
+        )
+    validate_workflow_compatibility(
+        input_dataset=_dataset([in_path], read_only=True),
+        output_dataset=_dataset([out_path]),
+        workflow=workflow,
+    )
+
+    # Multiple paths
+    with pytest.raises(ValueError, match="multiple input paths"):
+        validate_workflow_compatibility(
+            input_dataset=_dataset([in_path, in_path]), workflow=workflow
+        )
+    with pytest.raises(ValueError, match="Multiple paths in dataset"):
+        validate_workflow_compatibility(
+            input_dataset=_dataset([in_path]),
+            output_dataset=_dataset([]),
+            workflow=workflow,
+        )
+
+    # Types
+    with pytest.raises(TypeError):
+        validate_workflow_compatibility(
+            input_dataset=_dataset([in_path], type="image"),
+            workflow=workflow,
+        )
+    validate_workflow_compatibility(
+        input_dataset=_dataset([in_path], type="image"),
+        workflow=SimpleNamespace(name="workflow", input_type="Any"),
+    )